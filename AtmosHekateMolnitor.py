@@ -1,12 +1,23 @@
 import sys
 import os
+import copy
 import json
+import types
+import gzip
+import time
+import hashlib
 import pathlib
-import urllib.request
-import urllib.error
-import webbrowser
+import threading
+from functools import lru_cache
+import http.client
+import urllib.parse
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+try:
+    import orjson  # optional, faster JSON parsing/serialising
+except ImportError:
+    orjson = None
+
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QApplication,
@@ -18,7 +29,7 @@ from PyQt6.QtWidgets import (
     QTextEdit,
     QVBoxLayout,
     QHBoxLayout,
-    QGridLayout,
+    QFormLayout,
     QGroupBox,
     QMessageBox,
 )
@@ -28,6 +39,7 @@ from PyQt6.QtWidgets import (
 # Configuration paths (AppData on Windows, ~/.config else)
 # -------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> pathlib.Path:
     if os.name == "nt":
         base = os.getenv("LOCALAPPDATA")
@@ -41,6 +53,11 @@ def get_config_dir() -> pathlib.Path:
 CONFIG_DIR = get_config_dir()
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 CONFIG_FILE = CONFIG_DIR / "config.json"
+CACHE_DIR = CONFIG_DIR / "cache"
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# How long a cached release is served without asking GitHub again (seconds)
+CACHE_TTL = 15 * 60
 
 
 # -------------------------------------------------------
@@ -61,6 +78,32 @@ PROJECTS = {
         "hos_support": "Latest supported HOS: 20.5.0",
     },
 }
+PROJECTS = types.MappingProxyType(PROJECTS)  # read-only at runtime
+PROJECT_NAMES = tuple(PROJECTS)
+
+
+# -------------------------------------------------------
+# JSON helpers (orjson if installed, stdlib json otherwise)
+# -------------------------------------------------------
+
+def json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def write_bytes_atomic(path: pathlib.Path, data: bytes) -> None:
+    # Write next to the target, then swap it in, so a crash never
+    # leaves a half-written file behind
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
 
 
 # -------------------------------------------------------
@@ -71,8 +114,7 @@ def load_config() -> dict:
     if not CONFIG_FILE.exists():
         return {"local_versions": {}}
     try:
-        with CONFIG_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_loads(CONFIG_FILE.read_bytes())
         if "local_versions" not in data:
             data["local_versions"] = {}
         return data
@@ -80,63 +122,352 @@ def load_config() -> dict:
         return {"local_versions": {}}
 
 
-def save_config(config: dict) -> None:
+def save_config(config: dict) -> bool:
     try:
-        with CONFIG_FILE.open("w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        write_bytes_atomic(CONFIG_FILE, json_dumps(config, indent=True))
+        return True
     except Exception as e:
         print("Error saving config:", e)
+        return False
 
 
 # -------------------------------------------------------
-# GitHub fetcher (runs in QThread)
+# Release cache (one JSON file per API URL)
+# -------------------------------------------------------
+
+def get_cache_path(api_url: str) -> pathlib.Path:
+    digest = hashlib.sha1(api_url.encode("utf-8")).hexdigest()
+    return CACHE_DIR / (digest + ".json")
+
+
+def load_cache_entry(api_url: str) -> dict | None:
+    path = get_cache_path(api_url)
+    if not path.exists():
+        return None
+    try:
+        entry = json_loads(path.read_bytes())
+        if not isinstance(entry.get("data"), dict):
+            return None
+        return entry
+    except Exception:
+        return None
+
+
+def save_cache_entry(api_url: str, entry: dict) -> None:
+    try:
+        write_bytes_atomic(get_cache_path(api_url), json_dumps(entry))
+    except Exception as e:
+        print("Error saving cache:", e)
+
+
+# GitHub's anonymous rate limit is per client, not per URL, so the reset
+# time is kept in a single file shared by all projects
+RATE_LIMIT_FILE = CACHE_DIR / "rate_limit.json"
+
+
+def load_rate_limit_reset() -> float:
+    try:
+        return float(json_loads(RATE_LIMIT_FILE.read_bytes()).get("reset", 0))
+    except Exception:
+        return 0.0
+
+
+def save_rate_limit_reset(reset: float) -> None:
+    try:
+        write_bytes_atomic(RATE_LIMIT_FILE, json_dumps({"reset": reset}))
+    except Exception as e:
+        print("Error saving rate limit:", e)
+
+
+def format_clock(ts: float) -> str:
+    return time.strftime("%H:%M", time.localtime(ts))
+
+
+# -------------------------------------------------------
+# HTTP keep-alive pool (reuses TLS sessions per host)
+# -------------------------------------------------------
+
+HTTP_TIMEOUT = 10
+HTTP_RETRIES = 3
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+HTTP_BACKOFF = 0.5  # seconds, doubled after every attempt
+
+_idle_connections: dict[str, list[http.client.HTTPSConnection]] = {}
+_idle_lock = threading.Lock()
+
+
+def _acquire_connection(host: str) -> http.client.HTTPSConnection:
+    with _idle_lock:
+        idle = _idle_connections.get(host)
+        if idle:
+            return idle.pop()
+    return http.client.HTTPSConnection(host, timeout=HTTP_TIMEOUT)
+
+
+def _release_connection(host: str, conn: http.client.HTTPSConnection) -> None:
+    with _idle_lock:
+        _idle_connections.setdefault(host, []).append(conn)
+
+
+def http_get(url: str, headers: dict) -> tuple[http.client.HTTPResponse, bytes]:
+    """
+    GET an https URL over a pooled keep-alive connection.
+    Returns (response, body). Transient 5xx answers are retried up to
+    HTTP_RETRIES times with exponential backoff, honouring Retry-After.
+    """
+    for attempt in range(HTTP_RETRIES + 1):
+        resp, body = _http_get_once(url, headers)
+        if resp.status not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+            break
+        delay = HTTP_BACKOFF * 2 ** attempt
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, min(int(retry_after), 60))
+        time.sleep(delay)
+    return resp, body
+
+
+def _http_get_once(url: str, headers: dict) -> tuple[http.client.HTTPResponse, bytes]:
+    # A reused connection the server dropped while idle is replaced by a
+    # fresh one; errors on a fresh connection are raised
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    while True:
+        conn = _acquire_connection(parts.netloc)
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            if reused:
+                continue
+            raise
+        _release_connection(parts.netloc, conn)
+        return resp, body
+
+
+# -------------------------------------------------------
+# GitHub fetcher (runs in QThreadPool)
 # -------------------------------------------------------
 
 def fetch_latest_release(api_url: str) -> dict:
     """
     Fetch latest release info from GitHub API using stdlib only.
-    Returns dict with keys: tag, name, body, html_url, published_at
+    A cached copy younger than CACHE_TTL is returned without any request;
+    older copies are revalidated with their ETag (HTTP 304 = still current).
+    While GitHub's rate limit is exhausted only the cache is used.
+    Returns dict with keys: tag, name, body, html_url, published_at, cached
+    and, when throttled, rate_limited_until (unix time).
     """
+    entry = load_cache_entry(api_url)
+    if entry and time.time() - entry.get("ts", 0) < CACHE_TTL:
+        return dict(entry["data"], cached=True)
+
+    reset = load_rate_limit_reset()
+    if time.time() < reset:
+        if entry:
+            return dict(entry["data"], cached=True, rate_limited_until=reset)
+        raise RuntimeError(f"Rate-limited by GitHub until {format_clock(reset)}")
+
+    headers = {
+        "User-Agent": "AtmoHekateChecker/1.0 (Python)",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+        "Accept-Encoding": "gzip",
+    }
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+
     try:
-        req = urllib.request.Request(
-            api_url,
-            headers={"User-Agent": "AtmoHekateChecker/1.0 (Python)"},
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = resp.read().decode("utf-8")
-        obj = json.loads(data)
+        resp, data = http_get(api_url, headers)
+    except (OSError, http.client.HTTPException) as e:
+        raise RuntimeError(f"Network error: {e}")
+
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            reset = float(resp.headers.get("X-RateLimit-Reset", ""))
+        except ValueError:
+            reset = time.time() + 60
+        save_rate_limit_reset(reset)
+        if resp.status in (403, 429):
+            if entry:
+                return dict(entry["data"], cached=True, rate_limited_until=reset)
+            raise RuntimeError(f"Rate-limited by GitHub until {format_clock(reset)}")
+
+    if resp.status == 304 and entry:
+        # Release unchanged since the cached copy: just refresh its age
+        entry["ts"] = time.time()
+        save_cache_entry(api_url, entry)
+        return dict(entry["data"], cached=True)
+    if resp.status != 200:
+        raise RuntimeError(f"Network error: HTTP Error {resp.status}: {resp.reason}")
+
+    try:
+        if resp.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        obj = json_loads(data)  # bytes in, no separate decode step
         tag = (obj.get("tag_name") or "").strip()
         name = (obj.get("name") or "").strip()
         body = (obj.get("body") or "").strip()
         html_url = (obj.get("html_url") or "").strip()
         published_at = (obj.get("published_at") or "").strip()
-        return {
+        info = {
             "tag": tag,
             "name": name,
             "body": body,
             "html_url": html_url,
             "published_at": published_at,
         }
-    except urllib.error.URLError as e:
-        raise RuntimeError(f"Network error: {e}")
     except Exception as e:
         raise RuntimeError(f"Error: {e}")
 
+    etag = resp.headers.get("ETag")
+    save_cache_entry(api_url, {"ts": time.time(), "etag": etag, "data": info})
+    return dict(info, cached=False)
+
 
-class ReleaseFetcherThread(QThread):
-    finished_ok = pyqtSignal(dict)
-    finished_error = pyqtSignal(str)
+class FetchSignals(QObject):
+    finished_ok = pyqtSignal(str, dict)
+    finished_error = pyqtSignal(str, str)
 
-    def __init__(self, api_url: str, parent=None):
-        super().__init__(parent)
+
+class FetchRunnable(QRunnable):
+    def __init__(self, project_name: str, api_url: str, signals: FetchSignals):
+        super().__init__()
+        self.project_name = project_name
         self.api_url = api_url
+        self.signals = signals
 
     def run(self):
         try:
             info = fetch_latest_release(self.api_url)
-            self.finished_ok.emit(info)
+            self.signals.finished_ok.emit(self.project_name, info)
         except RuntimeError as e:
-            self.finished_error.emit(str(e))
+            self.signals.finished_error.emit(self.project_name, str(e))
+
+
+# -------------------------------------------------------
+# Config loader (runs in QThreadPool)
+# -------------------------------------------------------
+
+class ConfigSignals(QObject):
+    loaded = pyqtSignal(dict)
+
+
+class ConfigLoadRunnable(QRunnable):
+    def __init__(self, signals: ConfigSignals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        self.signals.loaded.emit(load_config())
+
+
+# -------------------------------------------------------
+# Stylesheet
+# -------------------------------------------------------
+
+STYLESHEET = """
+    QMainWindow {
+        background-color: #15171c;
+    }
+    QWidget {
+        color: #f3f3f4;
+        background-color: transparent;
+        font-family: "Segoe UI", "Calibri", sans-serif;
+    }
+    QGroupBox {
+        border: 1px solid #2c2f36;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 16px;
+        background-color: #1b1e24;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 14px;
+        padding: 0 6px;
+        background-color: #15171c;
+        color: #c7cad1;
+        font-weight: bold;
+        font-size: 10pt;
+    }
+    QLabel {
+        font-size: 10pt;
+        color: #e2e4ea;
+    }
+    QLabel#statusLabel {
+        font-weight: bold;
+    }
+    QComboBox {
+        background-color: #20232b;
+        border: 1px solid #3a3f4b;
+        border-radius: 6px;
+        padding: 4px 8px;
+        color: #f5f5f5;
+        font-size: 9.5pt;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #1f2229;
+        color: #f5f5f5;
+        selection-background-color: #2f80ed;
+    }
+    QPushButton {
+        background-color: #252932;
+        border: 1px solid #3b404d;
+        border-radius: 6px;
+        padding: 5px 12px;
+        color: #f3f3f4;
+        font-size: 9.5pt;
+    }
+    QPushButton:hover {
+        background-color: #2f3440;
+    }
+    QPushButton:pressed {
+        background-color: #232733;
+    }
+    QPushButton#dangerButton {
+        background-color: #b33939;
+        border-color: #d24f4f;
+    }
+    QPushButton#dangerButton:hover {
+        background-color: #c44545;
+    }
+    QTextEdit {
+        background-color: #0f1116;
+        color: #e6e6e6;
+        border-radius: 6px;
+        border: 1px solid #31343f;
+        padding: 6px;
+    }
+    QScrollBar:vertical {
+        background: #101218;
+        width: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #3b404d;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #4c5262;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+# Separates the release header from its notes in the changelog view
+CHANGELOG_DIVIDER = "\n\n" + "-" * 60 + "\n\n"
 
 
 # -------------------------------------------------------
@@ -150,26 +481,51 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Atmosphere / Hekate Release Checker")
         self.resize(880, 540)
 
-        # Data
-        self.config = load_config()
+        # Data (config is read off the GUI thread, see _on_config_loaded)
+        self.config = {"local_versions": {}}
+        self._config_on_disk = copy.deepcopy(self.config)
+        self._config_loaded = False
+        self._config_signals = ConfigSignals(self)
+        self._config_signals.loaded.connect(self._on_config_loaded)
         self.current_project_name = "Atmosphere"
         self.current_release_info = None
-        self.fetch_thread: ReleaseFetcherThread | None = None
+        self._last_changelog: str | None = None
+        self.release_info_by_project: dict[str, dict] = {}
+        self._in_flight: set[str] = set()
+        self._fetch_signals = FetchSignals(self)
+        self._fetch_signals.finished_ok.connect(self.on_fetch_success)
+        self._fetch_signals.finished_error.connect(self.on_fetch_error)
+
+        # Coalesce rapid "Check Now" clicks / project flips into one request
+        self._check_debounce = QTimer(self)
+        self._check_debounce.setSingleShot(True)
+        self._check_debounce.setInterval(250)
+        self._check_debounce.timeout.connect(self._do_check)
 
         # UI
         self._build_ui()
         self._apply_styles()
 
         # Initial state
+        self.btn_set_local.setEnabled(False)  # until the config is loaded
         self.update_local_version_label()
         self.update_hos_support_label()
+        QThreadPool.globalInstance().start(ConfigLoadRunnable(self._config_signals))
 
-        # Auto-check on startup
-        self.start_check()
+        # Auto-check on startup; the other projects are fetched in parallel
+        # so switching to them later needs no network round-trip
+        self._do_check()
+        for name in PROJECT_NAMES:
+            self.fetch_project(name)
 
     # ---------------- UI building -----------------
 
     def _build_ui(self):
+        # Shared fonts (built once instead of per label)
+        title_font = QFont("Segoe UI", 17, QFont.Weight.Bold)
+        bold10 = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        mono = QFont("Consolas", 9)
+
         central = QWidget()
         self.setCentralWidget(central)
 
@@ -179,79 +535,42 @@ class MainWindow(QMainWindow):
 
         # Title
         title_label = QLabel("Atmosphere / Hekate Release Checker")
-        title_font = QFont("Segoe UI", 17, QFont.Weight.Bold)
         title_label.setFont(title_font)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(title_label)
 
+        def bold_label(text: str) -> QLabel:
+            label = QLabel(text)
+            label.setFont(bold10)
+            return label
+
         # Top info group
         info_group = QGroupBox("Release Info")
-        info_layout = QGridLayout(info_group)
-        info_layout.setVerticalSpacing(6)
-        info_layout.setHorizontalSpacing(10)
-
-        row = 0
-
-        # Project selector
-        lbl_project = QLabel("Project:")
-        lbl_project.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        info_layout.addWidget(lbl_project, row, 0)
+        form = QFormLayout(info_group)
+        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
+        form.setVerticalSpacing(6)
+        form.setHorizontalSpacing(10)
 
         self.project_combo = QComboBox()
-        self.project_combo.addItems(PROJECTS.keys())
+        self.project_combo.addItems(PROJECT_NAMES)
         self.project_combo.currentTextChanged.connect(self.on_project_changed)
         self.project_combo.setMinimumWidth(220)
-        info_layout.addWidget(self.project_combo, row, 1, 1, 2)
-
-        row += 1
-
-        # Local version
-        lbl_local = QLabel("Local version:")
-        lbl_local.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        info_layout.addWidget(lbl_local, row, 0)
+        form.addRow(bold_label("Project:"), self.project_combo)
 
         self.local_value = QLabel("Not set")
-        info_layout.addWidget(self.local_value, row, 1, 1, 2)
-
-        row += 1
-
-        # Latest version
-        lbl_latest = QLabel("Latest on GitHub:")
-        lbl_latest.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        info_layout.addWidget(lbl_latest, row, 0)
+        form.addRow(bold_label("Local version:"), self.local_value)
 
         self.latest_value = QLabel("Unknown")
-        info_layout.addWidget(self.latest_value, row, 1, 1, 2)
-
-        row += 1
-
-        # HOS support
-        lbl_hos = QLabel("HOS support:")
-        lbl_hos.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        info_layout.addWidget(lbl_hos, row, 0)
+        form.addRow(bold_label("Latest on GitHub:"), self.latest_value)
 
         self.hos_value = QLabel("-")
-        info_layout.addWidget(self.hos_value, row, 1, 1, 2)
-
-        row += 1
-
-        # Published
-        lbl_pub = QLabel("Published:")
-        lbl_pub.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        info_layout.addWidget(lbl_pub, row, 0)
+        form.addRow(bold_label("HOS support:"), self.hos_value)
 
         self.published_value = QLabel("-")
-        info_layout.addWidget(self.published_value, row, 1, 1, 2)
-
-        row += 1
-
-        # Status
-        lbl_status = QLabel("Status:")
-        lbl_status.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        info_layout.addWidget(lbl_status, row, 0)
+        form.addRow(bold_label("Published:"), self.published_value)
 
         self.status_value = QLabel("Idle")
-        info_layout.addWidget(self.status_value, row, 1, 1, 2)
+        form.addRow(bold_label("Status:"), self.status_value)
 
         main_layout.addWidget(info_group)
 
@@ -284,110 +603,21 @@ class MainWindow(QMainWindow):
         cl_layout = QVBoxLayout(changelog_group)
         self.changelog_edit = QTextEdit()
         self.changelog_edit.setReadOnly(True)
-        self.changelog_edit.setFont(QFont("Consolas", 9))
-        self.changelog_edit.setPlainText("No data yet. Press 'Check Now'.")
+        self.changelog_edit.setFont(mono)
+        self.set_changelog_text("No data yet. Press 'Check Now'.")
         cl_layout.addWidget(self.changelog_edit)
         main_layout.addWidget(changelog_group, 1)  # stretch
 
     def _apply_styles(self):
-        # Dark, modern look
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #15171c;
-            }
-            QWidget {
-                color: #f3f3f4;
-                background-color: transparent;
-                font-family: "Segoe UI", "Calibri", sans-serif;
-            }
-            QGroupBox {
-                border: 1px solid #2c2f36;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 16px;
-                background-color: #1b1e24;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 14px;
-                padding: 0 6px;
-                background-color: #15171c;
-                color: #c7cad1;
-                font-weight: bold;
-                font-size: 10pt;
-            }
-            QLabel {
-                font-size: 10pt;
-                color: #e2e4ea;
-            }
-            QLabel#statusLabel {
-                font-weight: bold;
-            }
-            QComboBox {
-                background-color: #20232b;
-                border: 1px solid #3a3f4b;
-                border-radius: 6px;
-                padding: 4px 8px;
-                color: #f5f5f5;
-                font-size: 9.5pt;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #1f2229;
-                color: #f5f5f5;
-                selection-background-color: #2f80ed;
-            }
-            QPushButton {
-                background-color: #252932;
-                border: 1px solid #3b404d;
-                border-radius: 6px;
-                padding: 5px 12px;
-                color: #f3f3f4;
-                font-size: 9.5pt;
-            }
-            QPushButton:hover {
-                background-color: #2f3440;
-            }
-            QPushButton:pressed {
-                background-color: #232733;
-            }
-            QPushButton#dangerButton {
-                background-color: #b33939;
-                border-color: #d24f4f;
-            }
-            QPushButton#dangerButton:hover {
-                background-color: #c44545;
-            }
-            QTextEdit {
-                background-color: #0f1116;
-                color: #e6e6e6;
-                border-radius: 6px;
-                border: 1px solid #31343f;
-                padding: 6px;
-            }
-            QScrollBar:vertical {
-                background: #101218;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3b404d;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #4c5262;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-
         # Give the Quit button a "danger" style
         self.btn_quit.setObjectName("dangerButton")
 
+        # Dark, modern look; set once on the application, so every window
+        # shares one parsed stylesheet
+        app = QApplication.instance()
+        if app.styleSheet() != STYLESHEET:
+            app.setStyleSheet(STYLESHEET)
+
     # ---------------- Helpers -----------------
 
     def get_current_project_info(self) -> dict:
@@ -401,9 +631,18 @@ class MainWindow(QMainWindow):
         if "local_versions" not in self.config:
             self.config["local_versions"] = {}
         self.config["local_versions"][project_key] = version
-        save_config(self.config)
+        self.persist_config()
+
+    def persist_config(self) -> None:
+        if self.config == self._config_on_disk:
+            return  # nothing changed since the last load/save
+        if save_config(self.config):
+            self._config_on_disk = copy.deepcopy(self.config)
 
     def update_local_version_label(self):
+        if not self._config_loaded:
+            self.local_value.setText("Loading...")
+            return
         info = self.get_current_project_info()
         key = info["key"]
         local = self.get_local_version_for_project(key)
@@ -414,36 +653,71 @@ class MainWindow(QMainWindow):
         self.hos_value.setText(info.get("hos_support", "-"))
 
     def set_changelog_text(self, text: str):
+        if text == self._last_changelog:
+            return  # same notes: skip the QTextDocument rebuild
+        self._last_changelog = text
         self.changelog_edit.setPlainText(text)
 
     # ---------------- Events -----------------
 
+    def _on_config_loaded(self, config: dict):
+        self.config = config
+        self._config_on_disk = copy.deepcopy(config)
+        self._config_loaded = True
+        self.btn_set_local.setEnabled(True)
+        self.update_local_version_label()
+
+        # A release that arrived first was compared against an empty config
+        if self.current_release_info:
+            self.show_release_info(self.current_release_info, notify=True)
+
     def on_project_changed(self, name: str):
         self.current_project_name = name
         self.update_local_version_label()
         self.update_hos_support_label()
+        self.btn_check.setEnabled(name not in self._in_flight)
+
+        rel_info = self.release_info_by_project.get(name)
+        if rel_info:
+            self.show_release_info(rel_info, notify=False)
+            return
+
+        self.current_release_info = None
         self.latest_value.setText("Unknown")
         self.published_value.setText("-")
-        self.status_value.setText("Idle")
-        self.set_changelog_text("No data for this project yet. Press 'Check Now'.")
+        self.status_value.setText("Checking...")
+        self.set_changelog_text("No data for this project yet.")
+        self._check_debounce.start()
 
     def start_check(self):
-        if self.fetch_thread and self.fetch_thread.isRunning():
-            return  # already running
+        self._check_debounce.start()
 
-        info = self.get_current_project_info()
-        api_url = info["api_url"]
+    def _do_check(self):
+        if self.current_project_name in self._in_flight:
+            return  # already running
 
         self.status_value.setText("Checking...")
         self.btn_check.setEnabled(False)
+        self.fetch_project(self.current_project_name)
+
+    def fetch_project(self, name: str):
+        if name in self._in_flight:
+            return  # already running
+
+        self._in_flight.add(name)
+        runnable = FetchRunnable(name, PROJECTS[name]["api_url"], self._fetch_signals)
+        QThreadPool.globalInstance().start(runnable)
+
+    def on_fetch_success(self, project_name: str, rel_info: dict):
+        self._in_flight.discard(project_name)
+        self.release_info_by_project[project_name] = rel_info
+        if project_name != self.current_project_name:
+            return  # shown when the user switches to it
 
-        self.fetch_thread = ReleaseFetcherThread(api_url, self)
-        self.fetch_thread.finished_ok.connect(self.on_fetch_success)
-        self.fetch_thread.finished_error.connect(self.on_fetch_error)
-        self.fetch_thread.start()
+        self.show_release_info(rel_info, notify=True)
+        self.btn_check.setEnabled(True)
 
-    def on_fetch_success(self, rel_info: dict):
-        self.fetch_thread = None
+    def show_release_info(self, rel_info: dict, notify: bool):
         self.current_release_info = rel_info
 
         tag = rel_info.get("tag") or "Unknown"
@@ -462,11 +736,11 @@ class MainWindow(QMainWindow):
         if published and published != "-":
             header_lines.append(f"Published: {published}")
 
-        header = "\n".join(header_lines)
-        if header:
-            header += "\n\n" + "-" * 60 + "\n\n"
-
-        self.set_changelog_text(header + body)
+        if header_lines:
+            text = "\n".join(header_lines) + CHANGELOG_DIVIDER + body
+        else:
+            text = body
+        self.set_changelog_text(text)
 
         # Compare with local
         info = self.get_current_project_info()
@@ -479,23 +753,31 @@ class MainWindow(QMainWindow):
             if tag not in ("Unknown", ""):
                 if tag != local:
                     status = f"New version available! ({tag})"
-                    QMessageBox.information(
-                        self,
-                        "New Release Available",
-                        f"Project: {self.current_project_name}\n"
-                        f"Local: {local}\n"
-                        f"Latest: {tag}",
-                    )
+                    if notify:
+                        QMessageBox.information(
+                            self,
+                            "New Release Available",
+                            f"Project: {self.current_project_name}\n"
+                            f"Local: {local}\n"
+                            f"Latest: {tag}",
+                        )
                 else:
                     status = "You are up to date."
             else:
                 status = "Could not determine latest version."
 
+        if rel_info.get("rate_limited_until"):
+            until = format_clock(rel_info["rate_limited_until"])
+            status += f" (cached, rate-limited until {until})"
+        elif rel_info.get("cached"):
+            status += " (cached)"
         self.status_value.setText(status)
-        self.btn_check.setEnabled(True)
 
-    def on_fetch_error(self, msg: str):
-        self.fetch_thread = None
+    def on_fetch_error(self, project_name: str, msg: str):
+        self._in_flight.discard(project_name)
+        if project_name != self.current_project_name:
+            return
+
         self.latest_value.setText("Error")
         self.published_value.setText("-")
         self.set_changelog_text("Error while fetching release info.")
@@ -530,6 +812,8 @@ class MainWindow(QMainWindow):
     def open_github_page(self):
         info = self.get_current_project_info()
         url = info["page_url"]
+        import webbrowser  # deferred: pulls in subprocess/shlex/tempfile
+
         webbrowser.open(url)
 
 